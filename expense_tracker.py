@@ -1,17 +1,94 @@
 # Expense Tracker Application
 # This Python program allows users to add, edit, delete, view, and visualize personal expenses.
-# Data is saved in a JSON file, and matplotlib is used to display graphical summaries.
+# Data is saved in an append-only JSON Lines file, and matplotlib is used to display graphical summaries.
 from datetime import datetime
-from collections import defaultdict
 import json
-import matplotlib.pyplot as plt
+import os
+import re
+import sys
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard json module
+    orjson = None
+
+# Each line of the data file is one record; a later line with the same id overrides an earlier one
+DATA_FILENAME = "expenses.ndjson"
+# Whole-file JSON array used by earlier versions; imported once if no journal exists yet
+LEGACY_FILENAME = "expenses.json"
+
+# Largest number of categories drawn individually in the bar chart; the rest share an "Other" bar
+MAX_CHART_CATEGORIES = 15
+
+# Per-expense numpy columns; stored with spare capacity so adding an expense doesn't copy them
+_COLUMN_ARRAYS = ('amounts', 'name_ids', 'category_ids', 'dates', 'live')
+
+# Shape check for YYYY-MM-DD; year 0000 is excluded because datetime cannot represent it.
+# ASCII-only, so dates in other digit scripts go through the strptime rule instead of numpy
+_DATE_RE = re.compile(r"(?!0000)\d{4}-\d{2}-\d{2}", re.ASCII)
+
+
+def _dumps(obj):
+    """Serializes obj to single-line JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Write non-ASCII category names as raw UTF-8 (as orjson does) rather than 6-byte \u escapes
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(buf):
+    """Parses JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
+
+def _normalize_date(date_str):
+    """Returns date_str as zero-padded YYYY-MM-DD if strptime accepts it (e.g. 2024-1-5), else 'NaT'."""
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date().isoformat()
+    except (TypeError, ValueError):
+        # TypeError covers non-string values from a hand-edited data file, e.g. null
+        return 'NaT'
+
+
+def _parse_dates(date_strings):
+    """Parses YYYY-MM-DD strings into a datetime64[D] array, with NaT for invalid entries."""
+    # Older versions stored anything strptime accepted, such as non-padded 2024-1-5, so regex
+    # misses go through the old rule instead of being dropped; only unparsable dates become NaT
+    candidates = [date if isinstance(date, str) and _DATE_RE.fullmatch(date) else _normalize_date(date)
+                  for date in date_strings]
+    try:
+        return np.array(candidates, dtype='datetime64[D]')
+    except ValueError:
+        # A well-shaped but impossible date (e.g. 2024-02-30) fails the whole batch, so retry one by one
+        parsed = np.empty(len(candidates), dtype='datetime64[D]')
+        for idx, date in enumerate(candidates):
+            try:
+                parsed[idx] = np.datetime64(date, 'D')
+            except ValueError:
+                parsed[idx] = np.datetime64('NaT')
+        return parsed
+
 
 class Expense:
     """Represents a single expense entry with amount, category, and date."""
-    def __init__(self, amount, category, date):
+    # Fixed attribute set: no per-instance __dict__, which matters for ledgers with many entries
+    __slots__ = ('amount', 'category', 'category_key', 'date', 'id')
+
+    def __init__(self, amount, category, date, expense_id=None):
         self.amount = amount
         self.category = category
+        self.category_key = Expense.normalize_category(category)
         self.date = date
+        # Stable identifier used to match edit and delete records in the data file
+        self.id = expense_id
+
+    @staticmethod
+    def normalize_category(category):
+        """Returns the interned, case-insensitive lookup key for a category name."""
+        return sys.intern(category.strip().lower())
 
     def __str__(self):
         return f"Category: {self.category}, Amount: ₹{self.amount}, Date: {self.date}"
@@ -25,17 +102,182 @@ class Expense:
 
     @staticmethod
     def from_dict(data):
-        return Expense(data['amount'], data['category'], data['date'])
+        return Expense(data['amount'], data['category'], data['date'], data.get('id'))
 
 class ExpenseTracker:
     """Handles all operations related to managing and analyzing expenses."""
-    def __init__(self):
-        self.expenses = []
+    def __init__(self, filename=DATA_FILENAME):
+        # Expenses in display order; deleted ones are left as None until the list is compacted
+        self._entries = []
+        self._deleted_count = 0
+        self.filename = filename
+        self._next_id = 1
+        # Column-wise numpy copy of the expenses, rebuilt lazily after any change
+        self._columns = None
+        # Results of view_summary queries, kept until the expense list changes
+        self._summary_cache = {}
+
+    @property
+    def expenses(self):
+        """The current expenses in display order."""
+        return [exp for exp in self._entries if exp is not None]
+
+    @expenses.setter
+    def expenses(self, expenses):
+        self._entries = list(expenses)
+        self._deleted_count = 0
+        # Cached columns and summaries describe the old list, row for row
+        self._invalidate()
+
+    def _live_count(self):
+        """Returns the number of expenses that have not been deleted."""
+        return len(self._entries) - self._deleted_count
+
+    def _compact_entries(self):
+        """Drops deleted slots from the entry list; row positions change, so columns must be rebuilt."""
+        if self._deleted_count:
+            self._entries = [exp for exp in self._entries if exp is not None]
+            self._deleted_count = 0
+
+    def _invalidate(self):
+        """Discards cached data derived from the expense list; call after every change."""
+        self._columns = None
+        self._summary_cache.clear()
+
+    def _cached_summary(self, key, compute):
+        """Returns the cached result for key, computing and storing it on first use."""
+        if key not in self._summary_cache:
+            self._summary_cache[key] = compute()
+        return self._summary_cache[key]
+
+    def _tombstone_in_columns(self, idx):
+        """Marks one cached row as deleted in O(1), leaving every other row where it is."""
+        self._summary_cache.clear()
+        if self._columns is None:
+            return
+        columns = self._columns
+        # A zero amount and NaT date keep the row out of every total and time bucket
+        columns['amounts'][idx] = 0.0
+        columns['dates'][idx] = np.datetime64('NaT')
+        columns['live'][idx] = False
+
+    def _append_to_columns(self, expense):
+        """Adds one expense to the cached columns instead of rebuilding them from scratch."""
+        self._summary_cache.clear()
+        if self._columns is None:
+            return
+        columns = self._columns
+        name_table = columns['name_table']
+        category_table = columns['category_table']
+        count = columns['count']
+        if count == len(columns['amounts']):
+            # Buffers are full: double their capacity so each add costs amortized O(1)
+            capacity = max(2 * count, 16)
+            for name in _COLUMN_ARRAYS:
+                grown = np.empty(capacity, dtype=columns[name].dtype)
+                grown[:count] = columns[name][:count]
+                columns[name] = grown
+        columns['amounts'][count] = expense.amount
+        columns['name_ids'][count] = name_table.setdefault(expense.category, len(name_table))
+        columns['category_ids'][count] = category_table.setdefault(expense.category_key, len(category_table))
+        # add_expenses has already validated the date as zero-padded YYYY-MM-DD, so convert it directly
+        columns['dates'][count] = np.datetime64(expense.date, 'D')
+        columns['live'][count] = True
+        columns['count'] = count + 1
+
+    def _get_columns(self):
+        """Returns the expenses as parallel numpy arrays, building them on first use."""
+        if self._columns is None:
+            # Rows are built from the compacted list, so every row starts out live
+            self._compact_entries()
+            count = len(self._entries)
+            # Map each category name, exactly as entered, to a small integer id for the chart
+            name_table = {}
+            name_ids = np.fromiter(
+                (name_table.setdefault(exp.category, len(name_table)) for exp in self._entries),
+                dtype=np.int32, count=count)
+            # Map each normalized category to a small integer id for case-insensitive lookups
+            category_table = {}
+            category_ids = np.fromiter(
+                (category_table.setdefault(exp.category_key, len(category_table)) for exp in self._entries),
+                dtype=np.int32, count=count)
+            self._columns = {
+                'amounts': np.fromiter((exp.amount for exp in self._entries), dtype=np.float64, count=count),
+                'name_ids': name_ids,
+                'name_table': name_table,
+                'category_ids': category_ids,
+                'category_table': category_table,
+                # Invalid dates are stored as NaT so summaries can skip them
+                'dates': _parse_dates([exp.date for exp in self._entries]),
+                'live': np.ones(count, dtype=bool),
+                'count': count,
+            }
+        columns = self._columns
+        count = columns['count']
+        # Expose only the filled part of each buffer; slicing gives views, not copies
+        view = {name: columns[name][:count] for name in _COLUMN_ARRAYS}
+        view['name_table'] = columns['name_table']
+        view['category_table'] = columns['category_table']
+        return view
+
+    def _category_total(self, category_key):
+        """Returns the total spent in the category with the given normalized key."""
+        columns = self._get_columns()
+        target = columns['category_table'].get(category_key)
+        if target is None:
+            return 0.0
+        # One pass totals every category, so later queries for other categories are just an index
+        totals = self._cached_summary(('all_categories',), lambda: np.bincount(
+            columns['category_ids'], weights=columns['amounts'], minlength=len(columns['category_table'])))
+        return totals[target]
+
+    def _bucket_totals(self, time_choice):
+        """Groups spending by day (1), month (2) or ISO week (3) and returns (periods, totals) arrays in date order.
+
+        Weekly periods are the day numbers of each week's Monday. Expenses with invalid dates are skipped.
+        """
+        columns = self._get_columns()
+        dates = columns['dates']
+        valid = ~np.isnat(dates)
+        dates = dates[valid]
+        if time_choice == 1:
+            keys = dates
+        elif time_choice == 2:
+            keys = dates.astype('datetime64[M]')
+        else:
+            # Key each date by the Monday starting its ISO week (1970-01-01, day 0, was a Thursday)
+            days = dates.astype(np.int64)
+            keys = days - (days - 4) % 7
+        periods, inverse = np.unique(keys, return_inverse=True)
+        totals = np.bincount(inverse, weights=columns['amounts'][valid], minlength=len(periods))
+        return periods, totals
+
+    def _period_totals(self, time_choice, top=None):
+        """Returns (labels, totals) lists for a time summary, in date order.
+
+        If top is given, only the top highest-spending periods are returned, still in date order.
+        """
+        periods, totals = self._bucket_totals(time_choice)
+        if top is not None and top < len(periods):
+            # Partial selection of the largest totals; only those few indices need sorting
+            selected = np.sort(np.argpartition(totals, -top)[-top:])
+            periods, totals = periods[selected], totals[selected]
+        if time_choice == 3:
+            labels = []
+            for monday in periods.tolist():
+                year, week, _ = np.datetime64(monday, 'D').item().isocalendar()
+                labels.append(f"{year}-W{week}")
+        else:
+            labels = [str(period) for period in periods]
+        return labels, totals.tolist()
 
     def validate_date(self, date_str):# Convert the entered amount to float and validate input
         """Validates whether the given string is in YYYY-MM-DD date format."""
+        if not _DATE_RE.fullmatch(date_str):
+            return False
         try:
-            datetime.strptime(date_str, "%Y-%m-%d")
+            # The regex already pins the shape, so the C-level ISO parser only has to check the calendar
+            datetime.fromisoformat(date_str)
             return True
         except ValueError:
             return False
@@ -49,21 +291,23 @@ class ExpenseTracker:
             date = input("Enter the date (YYYY-MM-DD) or press Enter for today's date: ").strip()
             # Use today's date if the user doesn't provide one
             if not date:
-                date = datetime.now().strftime("%Y-%m-%d")
+                date = datetime.now().date().isoformat()
             if not self.validate_date(date):
                 print("Error: Invalid date format. Please use YYYY-MM-DD.")
                 return
             # Create and add expense object to the list
-            expense = Expense(amount, category, date)
-            self.expenses.append(expense)
+            expense = Expense(amount, category, date, self._next_id)
+            self._next_id += 1
+            self._entries.append(expense)
+            self._append_to_columns(expense)
             print(f"Success: ₹{amount} added to category '{category}' on {date}.")
-            self.save_to_file()
+            self._append_record(self._record(expense))
         except ValueError:
             print("Error: Invalid input. Please enter a numeric amount.")
 
     def view_summary(self):
         """Displays a summary of expenses based on user-selected criteria."""
-        if not self.expenses:
+        if not self._live_count():
             print("No expenses recorded yet.")
             return
         try:
@@ -77,13 +321,16 @@ class ExpenseTracker:
             print("Error: Invalid input. Please enter a number.")
             return
 
+        columns = self._get_columns()
         if choice == 1:
             category = input("Enter the category name: ").strip()
-            total = sum(exp.amount for exp in self.expenses if exp.category.lower() == category.lower())
+            category_key = Expense.normalize_category(category)
+            total = self._cached_summary(('category', category_key),
+                                         lambda: self._category_total(category_key))
             print(f"Total spending in category '{category}': ₹{total:.2f}")
         elif choice == 2:
             # Total spending overall
-            total = sum(exp.amount for exp in self.expenses)
+            total = self._cached_summary(('overall',), lambda: columns['amounts'].sum())
             print(f"Total overall spending: ₹{total:.2f}")
         elif choice == 3:
             try:
@@ -97,63 +344,152 @@ class ExpenseTracker:
                 print("Error: Invalid input. Please enter a number.")
                 return
 
-            summary = defaultdict(float)
-            for expense in self.expenses:
-                if not self.validate_date(expense.date):
-                    print(f"Warning: Skipping invalid date format '{expense.date}'.")
-                    continue
-                date_obj = datetime.strptime(expense.date, "%Y-%m-%d")
-                if time_choice == 1:
-                    key = expense.date
-                elif time_choice == 2:
-                    key = date_obj.strftime("%Y-%m")
-                elif time_choice == 3:
-                    year = date_obj.year
-                    week = date_obj.isocalendar()[1]
-                    key = f"{year}-W{week}"
-                else:
-                    print("Error: Invalid choice.")
-                    return
-                summary[key] += expense.amount
-
-            print("\nSpending summary over selected time period:")
-            for period, amount in sorted(summary.items()):
-                print(f"{period}: ₹{amount:.2f}")
+            if time_choice not in (1, 2, 3):
+                print("Error: Invalid choice.")
+                return
+            top = input("Show only the N highest-spending periods (or press Enter to show all): ").strip()
+            try:
+                top = int(top) if top else None
+            except ValueError:
+                print("Error: Invalid input. Please enter a number.")
+                return
+            if top is not None and top < 1:
+                print("Error: Please enter a positive number.")
+                return
+            # Cached like the totals so a repeated summary doesn't rescan every date
+            warnings = self._cached_summary(('date_warnings',), lambda: ''.join(
+                f"Warning: Skipping invalid date format '{self._entries[idx].date}'.\n"
+                for idx in np.flatnonzero(np.isnat(columns['dates']) & columns['live'])))
+            sys.stdout.write(warnings)
+            labels, totals = self._cached_summary(('period', time_choice, top),
+                                                  lambda: self._period_totals(time_choice, top))
+
+            # Build the whole report first and write it in one call rather than one print per row
+            rows = [f"{period}: ₹{amount:.2f}\n" for period, amount in zip(labels, totals)]
+            sys.stdout.write("\nSpending summary over selected time period:\n" + ''.join(rows))
         else:
             print("Error: Please choose a valid option (1, 2, or 3).")
 
-    def save_to_file(self, filename="expenses.json"):
-        """Saves all expenses to a JSON file."""
-        with open(filename, 'w') as file:
-            json.dump([exp.to_dict() for exp in self.expenses], file, indent=4)
+    @staticmethod
+    def _record(expense):
+        """Builds the data file record for an expense."""
+        return {'id': expense.id, **expense.to_dict()}
+
+    def _append_record(self, record, filename=None):
+        """Appends a single record to the data file instead of rewriting it."""
+        filename = filename or self.filename
+        with open(filename, 'ab') as file:
+            file.write(_dumps(record) + b'\n')
+            file.flush()
+            os.fsync(file.fileno())
+        print(f"Data saved successfully to '{filename}'.")
+
+    def save_to_file(self, filename=None):
+        """Rewrites the data file with one record per current expense, dropping edit and delete history."""
+        filename = filename or self.filename
+        temp_filename = filename + ".tmp"
+        with open(temp_filename, 'wb') as file:
+            file.write(b''.join(_dumps(self._record(exp)) + b'\n' for exp in self.expenses))
+            file.flush()
+            os.fsync(file.fileno())
+        # Swap the new file in atomically so a crash never leaves a half-written data file
+        os.replace(temp_filename, filename)
         print(f"Data saved successfully to '{filename}'.")
 
-    def load_from_file(self, filename="expenses.json"):
-        """Loads expenses from a JSON file into the application."""
+    def load_from_file(self, filename=None):
+        """Loads expenses by replaying the data file, compacting it once it is mostly history."""
+        filename = filename or self.filename
+        if not os.path.exists(filename) and os.path.exists(LEGACY_FILENAME):
+            self._import_legacy_file(LEGACY_FILENAME, filename)
+            return
         try:
-            with open(filename, 'r') as file:
-                data = json.load(file)
-                self.expenses = [Expense.from_dict(item) for item in data]
-            print(f"Successfully loaded {len(self.expenses)} expense(s) from '{filename}'.")
+            with open(filename, 'rb') as file:
+                content = file.read()
         except FileNotFoundError:
             print("No existing data found. Starting a new record.")
-        except json.JSONDecodeError:
+            return
+        lines = [line for line in content.splitlines() if line.strip()]
+        complete = not content or content.endswith(b'\n')
+        skipped = 0
+        try:
+            # Parse the whole journal with one parser call by presenting the lines as a JSON array
+            items = _loads(b'[' + b','.join(lines) + b']')
+        except ValueError:
+            # Fall back to line by line, e.g. for a line cut short by a crash mid-append. ValueError
+            # covers both JSONDecodeError and the UnicodeDecodeError the stdlib parser raises when
+            # the cut lands inside a multibyte UTF-8 character
+            items = []
+            for line in lines:
+                try:
+                    items.append(_loads(line))
+                except ValueError:
+                    skipped += 1
+        line_count = len(lines)
+        records = {}
+        for item in items:
+            if item.get('deleted'):
+                records.pop(item['id'], None)
+            else:
+                records[item['id']] = item
+        self.expenses = [Expense.from_dict(item) for item in records.values()]
+        self._next_id = max(records, default=0) + 1
+        # Validate every date in one pass up front so summaries only read the cached result
+        self._get_columns()
+        if skipped:
+            print(f"Warning: Skipped {skipped} corrupted line(s) in '{filename}'.")
+        print(f"Successfully loaded {len(self.expenses)} expense(s) from '{filename}'.")
+        # Rewrite only when superseded and deleted records outnumber live ones, or when a
+        # damaged or unterminated last line would corrupt the next append
+        if skipped or not complete or line_count - len(records) > len(records):
+            self.save_to_file(filename)
+
+    def _import_legacy_file(self, legacy_filename, filename):
+        """Converts a data file from the old whole-array JSON format into the new data file."""
+        try:
+            with open(legacy_filename, 'rb') as file:
+                data = _loads(file.read())
+        except ValueError:
+            # Covers json/orjson JSONDecodeError and UnicodeDecodeError from invalid UTF-8
             print("Error: Data file is corrupted. Starting with an empty list.")
+            return
+        self.expenses = [Expense(item['amount'], item['category'], item['date'], idx)
+                         for idx, item in enumerate(data, start=1)]
+        self._next_id = len(self.expenses) + 1
+        self._get_columns()
+        print(f"Successfully loaded {len(self.expenses)} expense(s) from '{legacy_filename}'.")
+        self.save_to_file(filename)
+
+    def _print_expense_list(self):
+        """Shows all expenses with index numbers, written to stdout in a single call.
+
+        Returns the entry positions of the listed expenses, in the order they were numbered.
+        """
+        positions = [idx for idx, exp in enumerate(self._entries) if exp is not None]
+        sys.stdout.write(''.join(f"{number}. {self._entries[idx]}\n"
+                                 for number, idx in enumerate(positions, start=1)))
+        return positions
 
     def delete_expense(self):
         """Allows the user to delete a specific expense by selecting it from the list."""
-        if not self.expenses:
+        if not self._live_count():
             print("No expenses available to delete.")
             return
-        # Show expenses with index numbers
-        for idx, exp in enumerate(self.expenses):
-            print(f"{idx + 1}. {exp}")
+        positions = self._print_expense_list()
         try:
             choice = int(input("Enter the number of the expense to delete: ").strip())
-            if 1 <= choice <= len(self.expenses):
-                removed = self.expenses.pop(choice - 1)
+            if 1 <= choice <= len(positions):
+                idx = positions[choice - 1]
+                removed = self._entries[idx]
+                # Leave a tombstone rather than shifting every later expense down
+                self._entries[idx] = None
+                self._deleted_count += 1
+                self._tombstone_in_columns(idx)
+                if self._deleted_count > self._live_count():
+                    # Mostly holes now: compact once, which keeps deletes amortized O(1)
+                    self._compact_entries()
+                    self._invalidate()
                 print(f"Deleted: {removed}")
-                self.save_to_file()
+                self._append_record({'id': removed.id, 'deleted': True})
             else:
                 print("Error: Invalid selection.")
         except ValueError:
@@ -161,15 +497,14 @@ class ExpenseTracker:
 
     def edit_expense(self):
         """Allows the user to edit a selected expense's details."""
-        if not self.expenses:
+        if not self._live_count():
             print("No expenses available to edit.")
             return
-        for idx, exp in enumerate(self.expenses):
-            print(f"{idx + 1}. {exp}")
+        positions = self._print_expense_list()
         try:
             choice = int(input("Enter the number of the expense to edit: ").strip())
-            if 1 <= choice <= len(self.expenses):
-                expense = self.expenses[choice - 1]
+            if 1 <= choice <= len(positions):
+                expense = self._entries[positions[choice - 1]]
                 print(f"Editing expense: {expense}")
                 new_amount = input("Enter new amount (or press Enter to keep current): ").strip()
                 new_category = input("Enter new category (or press Enter to keep current): ").strip()
@@ -182,38 +517,74 @@ class ExpenseTracker:
                         print("Invalid amount entered. Keeping existing value.")
                 if new_category:
                     expense.category = new_category
+                    expense.category_key = Expense.normalize_category(new_category)
                 if new_date:
                     if self.validate_date(new_date):
                         expense.date = new_date
                     else:
                         print("Invalid date format. Keeping existing date.")
-                self.save_to_file()
+                self._invalidate()
+                self._append_record(self._record(expense))
                 print("Expense updated successfully.")
             else:
                 print("Error: Invalid selection.")
         except ValueError:
             print("Error: Invalid input. Please enter a number.")
 
-    def graphical_summary(self):
-        """Displays a bar chart of expenses grouped by category using matplotlib."""
-        if not self.expenses:
+    def graphical_summary(self, max_categories=MAX_CHART_CATEGORIES):
+        """Displays a bar chart of the top categories by spending using matplotlib."""
+        if not self._live_count():
             print("No data available for graphical summary.")
             return
-        category_totals = defaultdict(float)
-        for exp in self.expenses:
-            category_totals[exp.category] += exp.amount
+        # Imported here rather than at module level: pyplot takes a noticeable share of startup time
+        # and is only needed once the user asks for a chart
+        import matplotlib.pyplot as plt
+        columns = self._get_columns()
+        # Group by category in one pass: sum amounts per category id
+        names = np.array(list(columns['name_table']), dtype=object)
+        totals = np.bincount(columns['name_ids'], weights=columns['amounts'], minlength=len(names))
+        # Names whose expenses have all been deleted stay in the table; leave them off the chart
+        present = np.bincount(columns['name_ids'], weights=columns['live'], minlength=len(names)) > 0
+        names, totals = names[present], totals[present]
         # Prepare data for plotting
-        categories = list(category_totals.keys())
-        amounts = [category_totals[cat] for cat in categories]
+        categories = names.tolist()
+        amounts = totals.tolist()
+        if len(categories) > max_categories:
+            # Keep the biggest categories and fold the long tail into a single bar
+            order = np.argsort(totals)[::-1]
+            top, rest = order[:max_categories], order[max_categories:]
+            categories = names[top].tolist() + ["Other"]
+            amounts = totals[top].tolist() + [totals[rest].sum()]
         # Plot the bar chart
-        plt.figure(figsize=(10, 6))
-        plt.bar(categories, amounts, color='skyblue')
-        plt.xlabel("Category")
-        plt.ylabel("Total Expenses (₹)")
-        plt.title("Expense Distribution by Category")
-        plt.xticks(rotation=45)
-        plt.grid(axis='y')
-        plt.tight_layout()
+        figure, axes = plt.subplots(figsize=(10, 6))
+        axes.bar(categories, amounts, color='skyblue')
+        axes.set_xlabel("Category")
+        axes.set_ylabel("Total Expenses (₹)")
+        axes.set_title("Expense Distribution by Category")
+        axes.tick_params(axis='x', labelrotation=45)
+        axes.grid(axis='y')
+        figure.tight_layout()
+        plt.show()
+
+    def graphical_timeseries(self):
+        """Displays daily spending over time as a line chart using matplotlib."""
+        if not self._live_count():
+            print("No data available for graphical summary.")
+            return
+        # One point per day with spending, however many expenses fall on it
+        days, totals = self._bucket_totals(1)
+        if not len(days):
+            print("No expenses with valid dates to plot.")
+            return
+        import matplotlib.pyplot as plt
+        figure, axes = plt.subplots(figsize=(10, 6))
+        axes.plot(days, totals, marker='.', color='steelblue')
+        axes.set_xlabel("Date")
+        axes.set_ylabel("Daily Expenses (₹)")
+        axes.set_title("Daily Spending Over Time")
+        axes.grid(axis='y')
+        figure.autofmt_xdate()
+        figure.tight_layout()
         plt.show()
 
 if __name__ == "__main__":  
@@ -226,8 +597,9 @@ if __name__ == "__main__":
         print("3. Edit Expense")
         print("4. Delete Expense")
         print("5. Graphical Summary")
-        print("6. Exit")
-        choice = input("Enter your choice (1-6): ").strip()
+        print("6. Spending Over Time Chart")
+        print("7. Exit")
+        choice = input("Enter your choice (1-7): ").strip()
         if choice == '1':
             tracker.add_expenses()
         elif choice == '2':
@@ -239,7 +611,9 @@ if __name__ == "__main__":
         elif choice == '5':
             tracker.graphical_summary()
         elif choice == '6':
+            tracker.graphical_timeseries()
+        elif choice == '7':
             print("Thank you for using the Expense Tracker. Goodbye!")
             break
         else:
-            print("Invalid choice. Please enter a number between 1 and 6.")
+            print("Invalid choice. Please enter a number between 1 and 7.")